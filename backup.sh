@@ -10,8 +10,10 @@ folder_name=$(hostname)
 vast_dir="/var/lib/vastai_kaalia"
 
 #install pv and pixz 
-echo -e "\nInstall pv pzstd"
-apt -qq install pv zstd -y
+if ! command -v pv > /dev/null || ! command -v pzstd > /dev/null; then
+  echo -e "\nInstall pv pzstd"
+  apt -qq install pv zstd -y
+fi
 
 # Stop services
 echo -e "\nStopping services..."
@@ -1,16 +1,28 @@
 #!/bin/bash
 
+# Bail out if ipmitool was killed by timeout (124 = TERM, 137 = KILL)
+check_timeout() {
+  if [ "$1" -eq 124 ] || [ "$1" -eq 137 ]; then
+    echo "Zone $2: ipmitool timed out, BMC not responding" >&2
+    exit 1
+  fi
+}
+
 # Run ipmitool command to get hex values for both zones
-hex_zone0=$(sudo ipmitool raw 0x30 0x70 0x66 0x00 0)
-hex_zone1=$(sudo ipmitool raw 0x30 0x70 0x66 0x00 1)
+# (after 30s sudo relays timeout's TERM to ipmitool; if that is ignored,
+# the KILL 5s later only hits sudo and ipmitool may be left orphaned)
+hex_zone0=$(timeout -k 5 30 sudo ipmitool raw 0x30 0x70 0x66 0x00 0)
+check_timeout $? 0
+hex_zone1=$(timeout -k 5 30 sudo ipmitool raw 0x30 0x70 0x66 0x00 1)
+check_timeout $? 1
 
 # Clean up the hex values by removing non-numeric characters
-clean_hex_zone0=$(echo "$hex_zone0" | tr -dc '[:alnum:]')
-clean_hex_zone1=$(echo "$hex_zone1" | tr -dc '[:alnum:]')
+clean_hex_zone0=${hex_zone0//[^[:alnum:]]/}
+clean_hex_zone1=${hex_zone1//[^[:alnum:]]/}
 
 # Convert cleaned hex values to decimals
-decimal_zone0=$(printf "%d" "0x$clean_hex_zone0")
-decimal_zone1=$(printf "%d" "0x$clean_hex_zone1")
+printf -v decimal_zone0 "%d" "0x$clean_hex_zone0"
+printf -v decimal_zone1 "%d" "0x$clean_hex_zone1"
 
 # Output the decimal values
 echo "Zone 0 fan speed: $decimal_zone0"
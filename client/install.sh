@@ -1,13 +1,13 @@
-# install docker
-apt-get update
-apt-get install -y apt-transport-https ca-certificates curl software-properties-common
-curl -fsSL https://download.docker.com/linux/ubuntu/gpg | sudo apt-key add -
-add-apt-repository  -y "deb [arch=amd64] https://download.docker.com/linux/ubuntu $(lsb_release -cs) stable"
-apt-get update -y 
-apt install docker.io -y
-
-# install docker-compose
-sudo apt-get install docker-compose-plugin
+# install docker and docker-compose, unless already there
+if ! docker compose version > /dev/null 2>&1; then
+  apt-get update
+  apt-get install -y apt-transport-https ca-certificates curl software-properties-common
+  curl -fsSL https://download.docker.com/linux/ubuntu/gpg | sudo apt-key add -
+  add-apt-repository  -y "deb [arch=amd64] https://download.docker.com/linux/ubuntu $(lsb_release -cs) stable"
+  apt-get update -y 
+  apt install docker.io -y
+  sudo apt-get install docker-compose-plugin
+fi
 
 export HOSTNAME=$(hostname)
 docker compose up -d
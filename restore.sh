@@ -11,14 +11,16 @@ vast_dir="/var/lib/vastai_kaalia"
 
 
 #install pv and pixz 
-echo -e "\nInstall pv pzstd"
-apt -qq install pv zstd -y
+if ! command -v pv > /dev/null || ! command -v pzstd > /dev/null; then
+  echo -e "\nInstall pv pzstd"
+  apt -qq install pv zstd -y
+fi
 
 
 # Tar the folder /var/lib/docker and send it to the server
 echo -e "\nSending the tar file to server..."
-cp /mnt/backup/vast/$folder_name $vast_dir
-cp /mnt/backup/vast/$folder_name $vast_dir
+cp /mnt/backup/vast/$folder_name/machine_id $vast_dir
+cp /mnt/backup/vast/$folder_name/host_port_range $vast_dir
 
 pzstd -dc /mnt/backup/vast/$folder_name/docker.tar.zst | pv --line-mode | sudo tar -xf - -C /
 